@@ -2,19 +2,46 @@
 """Main ingestion script for data ingestion to GCS."""
 
 import argparse
+import functools
+import io
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date as date_type
 from pathlib import Path
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from sources import PostgresSource, CSVSource
 from targets import GCSTarget
 
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
+# Rows per parquet row group; batches are collected up to this size so each
+# row group carries statistics for a meaningful slice of the data
+ROW_GROUP_SIZE = 128_000
+
+# Columns parsed as timestamps and used to derive the dt partition column
+TIMESTAMP_COLUMNS = frozenset(('created_at', 'updated_at'))
+
+# Prepare batches with Arrow compute instead of pandas when possible; batches
+# Arrow cannot convert (e.g. naive and offset strings mixed in one column) still
+# go through pandas. Both paths follow the same rule for timestamp strings:
+# offset values are normalised to UTC and stored without a zone, naive values are
+# kept as-is, and dt is the date of the stored value
+USE_ARROW_FAST_PATH = True
+
+
+@functools.lru_cache(maxsize=8)
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file.
 
+    Results are cached per path, so callers must not mutate the returned dict.
+
     Args:
         config_path: Path to YAML configuration file
 
@@ -22,7 +49,7 @@ def load_config(config_path: str) -> dict:
         Configuration dictionary
     """
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def validate_date(date_string: str) -> str:
@@ -44,17 +71,160 @@ def validate_date(date_string: str) -> str:
         raise ValueError(f"Invalid date format: {date_string}. Expected YYYY-MM-DD")
 
 
-def run_ingestion(config: dict, execution_date: str):
-    """Run data ingestion pipeline.
+def prepare_table(batch: pa.RecordBatch) -> pa.Table:
+    """Parse timestamp columns and add the dt partition column using Arrow only.
+
+    Args:
+        batch: Record batch extracted from a source
+
+    Returns:
+        Table with timestamp[us] columns and a date32 dt column
+
+    Raises:
+        pyarrow.ArrowInvalid: If a timestamp column cannot be cast by Arrow
+    """
+    table = pa.Table.from_batches([batch])
+
+    # Cast created_at/updated_at (timestamp, date or string) and any other
+    # timestamp column to microsecond precision, keeping the timezone
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            if field.name in TIMESTAMP_COLUMNS:
+                table = table.set_column(i, field.name, _parse_timestamps(table.column(i)))
+        elif field.name in TIMESTAMP_COLUMNS or pa.types.is_timestamp(field.type):
+            tz = field.type.tz if pa.types.is_timestamp(field.type) else None
+            column = pc.cast(table.column(i), pa.timestamp('us', tz=tz))
+            table = table.set_column(i, field.name, column)
+
+    # Add dt column for partitioning (date only), falling back to updated_at
+    dates = [
+        pc.cast(table[column], pa.date32())
+        for column in ('created_at', 'updated_at')
+        if column in table.column_names
+    ]
+    if dates:
+        table = table.append_column('dt', pc.coalesce(*dates))
+
+    return table
+
+
+def _parse_timestamps(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Parse a string column whose values are either all naive or all offset-suffixed.
+
+    Args:
+        column: String column of ISO timestamps
+
+    Returns:
+        timestamp[us] column; offset values are converted to UTC wall time
+
+    Raises:
+        pyarrow.ArrowInvalid: If the column mixes naive and offset values or
+            contains unparseable values
+    """
+    try:
+        return pc.cast(column, pa.timestamp('us'))
+    except pa.ArrowInvalid:
+        # Offset-suffixed values: parse as UTC instants, then drop the zone
+        return pc.cast(pc.cast(column, pa.timestamp('us', tz='UTC')), pa.timestamp('us'))
+
+
+def prepare_batch(batch: pa.RecordBatch) -> pd.DataFrame:
+    """Parse timestamp columns and add the dt partition column.
+
+    Args:
+        batch: Record batch extracted from a source
+
+    Returns:
+        DataFrame with datetime created_at/updated_at columns and a dt column
+    """
+    df = batch.to_pandas()
+
+    # Convert timestamp string columns to datetime (unparseable values become NaT).
+    # Values with a UTC offset are normalised to UTC and stored without a zone,
+    # naive values are kept as-is, so mixed offsets in one batch parse fine
+    for column in TIMESTAMP_COLUMNS.intersection(df.columns):
+        if not pd.api.types.is_datetime64_any_dtype(df[column]):
+            parsed = pd.to_datetime(
+                df[column], format='ISO8601', errors='coerce', utc=True, cache=True
+            )
+            df[column] = parsed.dt.tz_localize(None)
+
+    # Add dt column for partitioning (date only), falling back to updated_at
+    if 'created_at' in df.columns:
+        df['dt'] = df['created_at'].dt.date
+        if 'updated_at' in df.columns:
+            df['dt'] = df['dt'].where(df['created_at'].notna(), df['updated_at'].dt.date)
+    elif 'updated_at' in df.columns:
+        df['dt'] = df['updated_at'].dt.date
+
+    return df
+
+
+def build_schema(df: pd.DataFrame) -> pa.Schema:
+    """Build the Arrow schema used to write a DataFrame to parquet.
+
+    Timestamp columns are declared as microsecond precision and dt as date32,
+    so BigQuery-compatible types are produced during the pandas conversion
+    instead of by a separate coercion pass at write time.
+
+    Args:
+        df: Prepared DataFrame
+
+    Returns:
+        Arrow schema for the parquet file
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+    for i, field in enumerate(schema):
+        if pa.types.is_timestamp(field.type):
+            schema = schema.set(i, field.with_type(pa.timestamp('us', tz=field.type.tz)))
+        elif field.name == 'dt':
+            schema = schema.set(i, field.with_type(pa.date32()))
+
+    return schema
+
+
+def run_ingestion(config: dict, execution_date: str, parallelism: int = 1):
+    """Run every data ingestion pipeline in the configuration.
+
+    ``pipeline`` may be a single pipeline or a list of them. Pipelines are
+    I/O-bound (database/CSV reads and GCS uploads), so they run in threads.
 
     Args:
         config: Configuration dictionary
         execution_date: Date to filter data (YYYY-MM-DD)
+        parallelism: Maximum number of pipelines to run concurrently
     """
     print(f"Starting ingestion for date: {execution_date}")
 
+    pipelines = config['pipeline']
+    if isinstance(pipelines, dict):
+        pipelines = [pipelines]
+
+    if parallelism <= 1 or len(pipelines) == 1:
+        for pipeline_config in pipelines:
+            run_pipeline(config, pipeline_config, execution_date)
+        return
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        # Consume the results so the first pipeline failure is re-raised here
+        list(executor.map(
+            lambda pipeline_config: run_pipeline(config, pipeline_config, execution_date),
+            pipelines
+        ))
+
+
+def run_pipeline(config: dict, pipeline_config: dict, execution_date: str):
+    """Run a single data ingestion pipeline.
+
+    Args:
+        config: Configuration dictionary (for shared sections such as database)
+        pipeline_config: Pipeline configuration with source and target
+        execution_date: Date to filter data (YYYY-MM-DD)
+    """
+    print(f"Running pipeline: {pipeline_config.get('name', 'unnamed')}")
+
     # Get configurations
-    pipeline_config = config['pipeline']
     source_config = pipeline_config['source']
     target_config = pipeline_config['target']
     source_type = pipeline_config.get('source_type', 'postgres')
@@ -74,12 +244,9 @@ def run_ingestion(config: dict, execution_date: str):
     else:
         raise ValueError(f"Unsupported source type: {source_type}")
 
-    # Initialize target
+    # Initialize target (loads GCS credentials)
     target = GCSTarget(target_config)
 
-    # Setup GCS credentials
-    target.setup_credentials()
-
     # Get destination configuration
     dest_config = target.get_destination_config(execution_date)
     base_url = dest_config['base_url']  # gs://bucket
@@ -98,63 +265,91 @@ def run_ingestion(config: dict, execution_date: str):
         if source_type == 'csv':
             data = source.extract_data(
                 date_column=source_config['date_column'],
-                execution_date=execution_date
+                execution_date=execution_date,
+                batch_size=ROW_GROUP_SIZE
             )
         else:  # postgres
             data = source.extract_data(
                 table=source_config['table'],
                 date_column=source_config['date_column'],
                 execution_date=execution_date,
-                schema=config['database'].get('schema', 'public')
+                schema=config['database'].get('schema', 'public'),
+                batch_size=ROW_GROUP_SIZE
             )
 
-        # Convert data to list
-        data_list = list(data)
-
-        if not data_list:
-            print("No data to load for this date.")
-            return
-
-        # Convert timestamp strings to datetime objects and add dt partition column
-        for record in data_list:
-            # Convert timestamp string columns to datetime objects
-            for key, value in record.items():
-                if isinstance(value, str) and key in ['created_at', 'updated_at']:
-                    try:
-                        # Parse timestamp string to datetime object (preserves time)
-                        record[key] = datetime.fromisoformat(value)
-                    except (ValueError, AttributeError):
-                        pass  # Keep as string if parsing fails
-
-            # Add dt column for partitioning (date only)
-            if 'created_at' in record and isinstance(record['created_at'], datetime):
-                record['dt'] = record['created_at'].date()
-            elif 'updated_at' in record and isinstance(record['updated_at'], datetime):
-                record['dt'] = record['updated_at'].date()
-
-        # Convert to DataFrame
-        df = pd.DataFrame(data_list)
-
         # Generate filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{timestamp}.parquet"
         file_path = f"{full_path}/{filename}"
 
-        # Write parquet file directly to GCS
-        print(f"Writing {len(df)} records to {file_path}...")
+        # Stream batches into an in-memory parquet file. Source batches can be
+        # smaller than a row group (CSV blocks, driver batches), so they are
+        # collected until ROW_GROUP_SIZE rows are pending before being written
+        buffer = io.BytesIO()
+        writer = None
+        pending = []
+        pending_rows = 0
+        total_records = 0
+
+        try:
+            for batch in data:
+                if batch.num_rows == 0:
+                    continue
+
+                table = None
+                if USE_ARROW_FAST_PATH:
+                    try:
+                        table = prepare_table(batch)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                        pass  # Fall back to pandas parsing for this batch
+
+                if table is None:
+                    df = prepare_batch(batch)
+                    # Every row group follows the schema of the first batch
+                    schema = writer.schema if writer is not None else build_schema(df)
+                    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                elif writer is not None and not table.schema.equals(writer.schema):
+                    table = table.cast(writer.schema)
+
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        buffer,
+                        table.schema,
+                        compression='snappy',
+                        use_dictionary=True,
+                        data_page_size=1 << 20,
+                        write_statistics=True
+                    )
+
+                pending.append(table)
+                pending_rows += table.num_rows
+                total_records += table.num_rows
+
+                if pending_rows >= ROW_GROUP_SIZE:
+                    # Write whole row groups and carry the remainder forward
+                    combined = pa.concat_tables(pending)
+                    full_rows = pending_rows - pending_rows % ROW_GROUP_SIZE
+                    writer.write_table(combined.slice(0, full_rows), row_group_size=ROW_GROUP_SIZE)
+                    pending = [combined.slice(full_rows)]
+                    pending_rows -= full_rows
+
+            if pending_rows:
+                writer.write_table(pa.concat_tables(pending), row_group_size=ROW_GROUP_SIZE)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            print("No data to load for this date.")
+            return
 
-        # Write using pandas to_parquet with gcsfs (simpler approach)
-        # Use coerce_timestamps='us' for BigQuery compatibility (microsecond precision)
-        df.to_parquet(
-            file_path,
-            engine='pyarrow',
-            compression='snappy',
-            index=False,
-            coerce_timestamps='us'  # Convert timestamps to microseconds (BigQuery compatible)
-        )
+        # Upload the finished file in one call
+        file_data = buffer.getvalue()
+        print(f"Writing {total_records} records to {file_path}...")
+        target.write_file(file_path, file_data)
 
-        print(f"✓ Successfully wrote {len(df)} records to {file_path}")
-        print(f"  File size: {df.memory_usage(deep=True).sum() / 1024:.2f} KB")
+        print(f"✓ Successfully wrote {total_records} records to {file_path}")
+        print(f"  File size: {len(file_data) / 1024:.2f} KB")
 
 
 def main():
@@ -174,6 +369,12 @@ def main():
         required=True,
         help='Execution date for data filtering (YYYY-MM-DD format)'
     )
+    parser.add_argument(
+        '--parallel-tables',
+        type=int,
+        default=1,
+        help='Number of pipelines to ingest concurrently when the config lists several (default: 1)'
+    )
 
     args = parser.parse_args()
 
@@ -185,11 +386,13 @@ def main():
 
     # Run ingestion
     try:
-        run_ingestion(config, execution_date)
+        run_ingestion(config, execution_date, parallelism=args.parallel_tables)
         print("Ingestion completed successfully!")
     except Exception as e:
         print(f"Error during ingestion: {str(e)}")
         raise
+    finally:
+        PostgresSource.close_pools()
 
 
 if __name__ == '__main__':
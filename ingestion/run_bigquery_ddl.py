@@ -3,11 +3,16 @@
 
 import argparse
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from google.cloud import bigquery
 from google.api_core import exceptions
 
+# Matches a whole line containing only a -- comment, including its newline
+_COMMENT_LINE_RE = re.compile(r'^[ \t]*--[^\n]*(?:\n|$)', re.MULTILINE)
+
 
 def setup_bigquery_client(credentials_path: Optional[str] = None) -> bigquery.Client:
     """Initialize BigQuery client.
@@ -67,18 +72,17 @@ def read_sql_file(file_path: Path) -> str:
     with open(file_path, 'r') as f:
         content = f.read()
 
-    # Remove single-line comments that start with --
-    lines = []
-    for line in content.split('\n'):
-        # Keep lines that aren't pure comments
-        stripped = line.strip()
-        if not stripped.startswith('--'):
-            lines.append(line)
-
-    return '\n'.join(lines).strip()
+    # Remove lines that are pure -- comments (inline trailing comments are kept)
+    return _COMMENT_LINE_RE.sub('', content).strip()
 
 
-def execute_sql(client: bigquery.Client, sql: str, file_name: str, dry_run: bool = False) -> bool:
+def execute_sql(
+    client: bigquery.Client,
+    sql: str,
+    file_name: str,
+    dry_run: bool = False,
+    log: Callable[[str], None] = print
+) -> bool:
     """Execute SQL query on BigQuery.
 
     Args:
@@ -86,45 +90,133 @@ def execute_sql(client: bigquery.Client, sql: str, file_name: str, dry_run: bool
         sql: SQL query to execute
         file_name: Name of the SQL file (for logging)
         dry_run: If True, validate query without executing
+        log: Function that receives each output line (default: print)
 
     Returns:
         True if successful, False otherwise
     """
     try:
         if dry_run:
-            print(f"\n[DRY RUN] Validating: {file_name}")
-            print("-" * 60)
+            log(f"\n[DRY RUN] Validating: {file_name}")
+            log("-" * 60)
             # Create job config for dry run
             job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
             query_job = client.query(sql, job_config=job_config)
 
             # Dry run doesn't return results, just validates
-            print(f"✓ Query validation successful")
-            print(f"  This query will process {query_job.total_bytes_processed:,} bytes when run")
+            log(f"✓ Query validation successful")
+            log(f"  This query will process {query_job.total_bytes_processed:,} bytes when run")
             return True
         else:
-            print(f"\n[EXECUTE] Running: {file_name}")
-            print("-" * 60)
+            log(f"\n[EXECUTE] Running: {file_name}")
+            log("-" * 60)
 
             # Execute the query
             query_job = client.query(sql)
             query_job.result()  # Wait for completion
 
-            print(f"✓ Successfully executed {file_name}")
-            print(f"  Job ID: {query_job.job_id}")
-            print(f"  Bytes processed: {query_job.total_bytes_processed:,}")
+            log(f"✓ Successfully executed {file_name}")
+            log(f"  Job ID: {query_job.job_id}")
+            log(f"  Bytes processed: {query_job.total_bytes_processed:,}")
             return True
 
     except exceptions.GoogleAPIError as e:
-        print(f"✗ Error executing {file_name}")
-        print(f"  Error: {str(e)}")
+        log(f"✗ Error executing {file_name}")
+        log(f"  Error: {str(e)}")
         return False
     except Exception as e:
-        print(f"✗ Unexpected error executing {file_name}")
-        print(f"  Error: {str(e)}")
+        log(f"✗ Unexpected error executing {file_name}")
+        log(f"  Error: {str(e)}")
         return False
 
 
+def execute_concurrently(
+    client: bigquery.Client,
+    sql_files: List[Path],
+    max_concurrency: int,
+    dry_run: bool = False,
+    continue_on_error: bool = False
+) -> Tuple[int, int]:
+    """Execute independent SQL files concurrently on BigQuery.
+
+    Each file's output is buffered and printed as one block when it finishes.
+    On a failure without continue_on_error, files that have not started are
+    cancelled, but files already running are awaited and counted.
+
+    Args:
+        client: BigQuery client
+        sql_files: SQL files to execute
+        max_concurrency: Maximum number of files executed at once
+        dry_run: If True, validate queries without executing
+        continue_on_error: If True, keep starting files after a failure
+
+    Returns:
+        Tuple of (successful, failed) counts
+    """
+    successful = 0
+    failed = 0
+
+    # Read all files up front so submission is not interleaved with file I/O
+    sql_jobs = []
+    for sql_file in sql_files:
+        try:
+            sql_content = read_sql_file(sql_file)
+
+            if not sql_content:
+                print(f"\n⚠️  Skipping {sql_file.name}: Empty file")
+                continue
+
+            sql_jobs.append((sql_file, sql_content))
+
+        except Exception as e:
+            print(f"\n✗ Error processing {sql_file.name}: {str(e)}")
+            failed += 1
+            if not continue_on_error:
+                print("\n❌ Stopping execution due to error")
+                return successful, failed
+
+    def run(sql_content: str, file_name: str) -> Tuple[bool, List[str]]:
+        lines = []
+        success = execute_sql(client, sql_content, file_name, dry_run=dry_run, log=lines.append)
+        return success, lines
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {
+            executor.submit(run, sql_content, sql_file.name): sql_file
+            for sql_file, sql_content in sql_jobs
+        }
+        stopping = False
+        cancelled = 0
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+
+            sql_file = futures[future]
+            try:
+                success, lines = future.result()
+                print("\n".join(lines))
+            except Exception as e:
+                print(f"\n✗ Error processing {sql_file.name}: {str(e)}")
+                success = False
+
+            if success:
+                successful += 1
+            else:
+                failed += 1
+                if not continue_on_error and not stopping:
+                    stopping = True
+                    # Only queued files can be cancelled; running ones are still collected
+                    cancelled = sum(f.cancel() for f in futures)
+                    print("\n❌ Stopping execution due to error")
+                    print("   Use --continue-on-error to continue on errors")
+
+        if cancelled:
+            print(f"\n⚠️  {cancelled} file(s) not started due to error")
+
+    return successful, failed
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -147,6 +239,9 @@ Examples:
   # Dry run (validate only, don't execute)
   python run_bigquery_ddl.py --dry-run
 
+  # Execute files one at a time, in order
+  python run_bigquery_ddl.py --max-concurrency 1
+
   # Custom SQL folder
   python run_bigquery_ddl.py --sql-folder /path/to/sql/files
         """
@@ -189,6 +284,13 @@ Examples:
         help='Continue executing remaining files even if one fails'
     )
 
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of SQL files executed concurrently (default: 8, use 1 for sequential order)'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -228,36 +330,46 @@ Examples:
         successful = 0
         failed = 0
 
-        for sql_file in sql_files:
-            try:
-                sql_content = read_sql_file(sql_file)
-
-                if not sql_content:
-                    print(f"\n⚠️  Skipping {sql_file.name}: Empty file")
-                    continue
-
-                success = execute_sql(
-                    client,
-                    sql_content,
-                    sql_file.name,
-                    dry_run=args.dry_run
-                )
-
-                if success:
-                    successful += 1
-                else:
+        if args.max_concurrency <= 1:
+            # Sequential: files run in order and the first failure stops the rest
+            for sql_file in sql_files:
+                try:
+                    sql_content = read_sql_file(sql_file)
+
+                    if not sql_content:
+                        print(f"\n⚠️  Skipping {sql_file.name}: Empty file")
+                        continue
+
+                    success = execute_sql(
+                        client,
+                        sql_content,
+                        sql_file.name,
+                        dry_run=args.dry_run
+                    )
+
+                    if success:
+                        successful += 1
+                    else:
+                        failed += 1
+                        if not args.continue_on_error:
+                            print("\n❌ Stopping execution due to error")
+                            print("   Use --continue-on-error to continue on errors")
+                            break
+
+                except Exception as e:
+                    print(f"\n✗ Error processing {sql_file.name}: {str(e)}")
                     failed += 1
                     if not args.continue_on_error:
                         print("\n❌ Stopping execution due to error")
-                        print("   Use --continue-on-error to continue on errors")
                         break
-
-            except Exception as e:
-                print(f"\n✗ Error processing {sql_file.name}: {str(e)}")
-                failed += 1
-                if not args.continue_on_error:
-                    print("\n❌ Stopping execution due to error")
-                    break
+        else:
+            successful, failed = execute_concurrently(
+                client,
+                sql_files,
+                max_concurrency=args.max_concurrency,
+                dry_run=args.dry_run,
+                continue_on_error=args.continue_on_error
+            )
 
         # Print summary
         print("\n" + "=" * 60)
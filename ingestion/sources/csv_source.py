@@ -1,9 +1,11 @@
 """CSV source module for data ingestion."""
 
-from datetime import datetime
 from typing import Iterator, Dict, Any
 import csv
 from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
 
 class CSVSource:
@@ -23,16 +25,22 @@ class CSVSource:
         date_column: str,
         execution_date: str,
         batch_size: int = 1000
-    ) -> Iterator[Dict[str, Any]]:
+    ) -> Iterator[pa.RecordBatch]:
         """Extract data from CSV file filtered by date.
 
+        The file is parsed and filtered with Arrow's CSV reader and compute
+        kernels. Every column is kept as a string so the output schema matches
+        the BigQuery external table definitions, and rows are matched on the
+        YYYY-MM-DD prefix of ``date_column`` so values with a time or zone
+        offset never fail the read.
+
         Args:
             date_column: Column name to filter by date
             execution_date: Date to filter (YYYY-MM-DD format)
-            batch_size: Number of rows to yield per batch (for consistency)
+            batch_size: Number of rows to yield per batch
 
         Yields:
-            Dictionary representing each row
+            Arrow record batches of matching rows
         """
         if not self.file_path:
             raise ValueError("file_path is required in source configuration")
@@ -41,15 +49,26 @@ class CSVSource:
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {self.file_path}")
 
-        with open(file_path, 'r', encoding=self.encoding) as csvfile:
-            reader = csv.DictReader(csvfile)
+        # Read only the header to know which columns to pin as strings
+        with open(file_path, 'r', encoding=self.encoding, newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+
+        if date_column not in header:
+            return
+
+        column_types = {column: pa.string() for column in header}
+
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=self.encoding, block_size=64 << 20),
+            convert_options=pa_csv.ConvertOptions(column_types=column_types)
+        )
+
+        # Filter by date (YYYY-MM-DD prefix of the date column)
+        row_dates = pc.utf8_slice_codeunits(pc.utf8_trim_whitespace(table[date_column]), 0, 10)
+        table = table.filter(pc.equal(row_dates, execution_date))
 
-            for row in reader:
-                # Filter by date
-                if date_column in row:
-                    row_date = row[date_column].split()[0]  # Extract date part (YYYY-MM-DD)
-                    if row_date == execution_date:
-                        yield row
+        yield from table.to_batches(max_chunksize=batch_size)
 
     def __enter__(self):
         """Context manager entry."""
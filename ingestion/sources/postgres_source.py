@@ -1,13 +1,53 @@
 """PostgreSQL source module for data ingestion."""
 
+import os
+import threading
 from datetime import datetime
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, ClassVar, Tuple
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from urllib.parse import quote, urlencode
+
+# Arrow types for Postgres type OIDs that COPY's text output can be parsed
+# into losslessly; every other type (numeric, varchar, json, ...) stays a string
+ARROW_TYPES_BY_OID = {
+    16: pa.bool_(),                      # bool
+    20: pa.int64(),                      # int8
+    21: pa.int16(),                      # int2
+    23: pa.int32(),                      # int4
+    700: pa.float32(),                   # float4
+    701: pa.float64(),                   # float8
+    1082: pa.date32(),                   # date
+    1114: pa.timestamp('us'),            # timestamp
+    1184: pa.timestamp('us', tz='UTC'),  # timestamptz
+}
+
+# ADBC returns query results as Arrow record batches; it is optional
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+except ImportError:
+    adbc_postgresql = None
 
 
 class PostgresSource:
-    """PostgreSQL data source for extracting data."""
+    """PostgreSQL data source for extracting data.
+
+    By default connections are borrowed from a process-wide psycopg2 pool
+    shared by every instance with the same connection settings, and rows are
+    streamed with ``COPY``. With ``use_adbc: true`` (and
+    ``adbc_driver_postgresql`` installed) rows are read through ADBC straight
+    into Arrow record batches instead. Both paths open read-only UTC sessions
+    and share the same ``max_connections`` limit.
+    """
+
+    _pools: ClassVar[Dict[Tuple, ThreadedConnectionPool]] = {}
+    # One semaphore per database holding a slot per allowed connection, so
+    # callers wait for a free connection instead of getting PoolError
+    _slots: ClassVar[Dict[Tuple, threading.BoundedSemaphore]] = {}
+    _pools_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, db_config: Dict[str, Any]):
         """Initialize PostgreSQL source.
@@ -17,22 +57,106 @@ class PostgresSource:
         """
         self.db_config = db_config
         self.connection = None
+        self.use_adbc = adbc_postgresql is not None and db_config.get('use_adbc', False)
+        self.max_connections = db_config.get('max_connections', os.cpu_count() or 1)
 
-    def connect(self):
-        """Establish connection to PostgreSQL database."""
-        self.connection = psycopg2.connect(
-            host=self.db_config['host'],
-            port=self.db_config['port'],
-            database=self.db_config['database'],
-            user=self.db_config['user'],
-            password=self.db_config['password']
+    def _get_key(self) -> Tuple:
+        """Return the connection settings that identify this source's database."""
+        return tuple(
+            self.db_config[name] for name in ('host', 'port', 'database', 'user', 'password')
         )
 
+    def _get_slots(self) -> threading.BoundedSemaphore:
+        """Return the semaphore limiting open connections to max_connections."""
+        key = self._get_key()
+        with self._pools_lock:
+            slots = self._slots.get(key)
+            if slots is None:
+                slots = threading.BoundedSemaphore(self.max_connections)
+                self._slots[key] = slots
+        return slots
+
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Return the connection pool for this source's settings, creating it on first use."""
+        key = self._get_key()
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=self.max_connections,
+                    host=self.db_config['host'],
+                    port=self.db_config['port'],
+                    database=self.db_config['database'],
+                    user=self.db_config['user'],
+                    password=self.db_config['password']
+                )
+                self._pools[key] = pool
+        return pool
+
+    def _get_uri(self) -> str:
+        """Build the libpq connection URI used by ADBC.
+
+        The session is read-only and pinned to UTC, matching the COPY path.
+        """
+        user = quote(str(self.db_config['user']), safe='')
+        password = quote(str(self.db_config['password']), safe='')
+        options = urlencode(
+            {'options': '-c default_transaction_read_only=on -c TimeZone=UTC'},
+            quote_via=quote
+        )
+        return (
+            f"postgresql://{user}:{password}@{self.db_config['host']}:"
+            f"{self.db_config['port']}/{quote(str(self.db_config['database']), safe='')}"
+            f"?{options}"
+        )
+
+    def connect(self):
+        """Open an ADBC connection, or borrow a psycopg2 connection from the pool."""
+        slots = self._get_slots()
+        # Block until a connection slot is free; getconn() itself raises when exhausted
+        slots.acquire()
+
+        if self.use_adbc:
+            try:
+                self.connection = adbc_postgresql.connect(self._get_uri())
+            except Exception:
+                slots.release()
+                raise
+            return
+
+        pool = self._get_pool()
+        try:
+            self.connection = pool.getconn()
+            # Extracts only read, so let the server run them in one read-only snapshot
+            self.connection.set_session(readonly=True, autocommit=False)
+        except Exception:
+            if self.connection:
+                pool.putconn(self.connection)
+                self.connection = None
+            slots.release()
+            raise
+
     def disconnect(self):
-        """Close database connection."""
+        """Close the ADBC connection, or return the psycopg2 connection to the pool."""
         if self.connection:
-            self.connection.close()
-            self.connection = None
+            try:
+                if self.use_adbc:
+                    self.connection.close()
+                else:
+                    self._get_pool().putconn(self.connection)
+            finally:
+                self.connection = None
+                self._get_slots().release()
+
+    @classmethod
+    def close_pools(cls):
+        """Close every pooled connection (call once at process shutdown)."""
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.closeall()
+            cls._pools.clear()
+            cls._slots.clear()
 
     def extract_data(
         self,
@@ -40,42 +164,124 @@ class PostgresSource:
         date_column: str,
         execution_date: str,
         schema: str = 'public',
-        batch_size: int = 1000
-    ) -> Iterator[Dict[str, Any]]:
+        batch_size: int = 50000
+    ) -> Iterator[pa.RecordBatch]:
         """Extract data from PostgreSQL table filtered by date.
 
+        With ADBC the result arrives as Arrow record batches over the binary
+        protocol. Otherwise it is streamed with ``COPY ... TO STDOUT`` and
+        parsed by Arrow's CSV reader. Neither path builds a Python object per row.
+
         Args:
             table: Table name to extract from
             date_column: Column name to filter by date
             execution_date: Date to filter (YYYY-MM-DD format)
             schema: Database schema (default: public)
-            batch_size: Number of rows to fetch per batch
+            batch_size: Maximum number of rows per yielded batch
 
         Yields:
-            Dictionary representing each row
+            Arrow record batches with the extracted rows
         """
         if not self.connection:
             self.connect()
 
-        # Build query with date filter
-        query = f"""
+        if self.use_adbc:
+            yield from self._extract_data_adbc(
+                table, date_column, execution_date, schema, batch_size
+            )
+            return
+
+        # Build query with a half-open range on the raw column so an index
+        # on date_column can be used (DATE(column) = %s cannot use one)
+        query = sql.SQL("""
             SELECT *
             FROM {schema}.{table}
-            WHERE DATE({date_column}) = %s
-        """
+            WHERE {date_column} >= %s::timestamp
+              AND {date_column} < %s::timestamp + interval '1 day'
+        """).format(
+            schema=sql.Identifier(schema),
+            table=sql.Identifier(table),
+            date_column=sql.Identifier(date_column)
+        )
+
+        cursor = self.connection.cursor()
+        try:
+            # Arrow parses ISO dates/timestamps; don't depend on the server's DateStyle.
+            # Pin the session to UTC so the day range below and the dt partition
+            # (derived from the UTC timestamptz values) describe the same day
+            cursor.execute("SET LOCAL datestyle TO 'ISO, YMD'")
+            cursor.execute("SET LOCAL timezone TO 'UTC'")
+
+            # Take column types from the server instead of letting Arrow infer
+            # them from text (which would turn '00123' into 123, etc.)
+            cursor.execute(
+                sql.SQL("{} LIMIT 0").format(query),
+                (execution_date, execution_date)
+            )
+            column_types = {
+                column.name: ARROW_TYPES_BY_OID.get(column.type_code, pa.string())
+                for column in cursor.description
+            }
+
+            # COPY does not accept bind parameters, so render them client-side
+            select = cursor.mogrify(query, (execution_date, execution_date)).decode()
+            copy_query = f"COPY ({select}) TO STDOUT WITH (FORMAT CSV, HEADER)"
 
-        cursor = self.connection.cursor(cursor_factory=RealDictCursor)
-        cursor.execute(query, (execution_date,))
+            yield from _stream_copy(
+                cursor,
+                copy_query,
+                pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    # Postgres writes NULL as an unquoted empty field and nothing
+                    # else; empty strings are "" and values like NA or NaN are data
+                    null_values=[''],
+                    strings_can_be_null=True,
+                    quoted_strings_can_be_null=False,
+                    true_values=['t'],
+                    false_values=['f']
+                ),
+                batch_size
+            )
+        finally:
+            cursor.close()
 
-        while True:
-            rows = cursor.fetchmany(batch_size)
-            if not rows:
-                break
+    def _extract_data_adbc(
+        self,
+        table: str,
+        date_column: str,
+        execution_date: str,
+        schema: str,
+        batch_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """Extract data through ADBC, yielding the driver's Arrow batches.
 
-            for row in rows:
-                yield dict(row)
+        Args:
+            table: Table name to extract from
+            date_column: Column name to filter by date
+            execution_date: Date to filter (YYYY-MM-DD format)
+            schema: Database schema
+            batch_size: Maximum number of rows per yielded batch
 
-        cursor.close()
+        Yields:
+            Arrow record batches with the extracted rows
+        """
+        date_column = _quote_identifier(date_column)
+        query = f"""
+            SELECT *
+            FROM {_quote_identifier(schema)}.{_quote_identifier(table)}
+            WHERE {date_column} >= $1::timestamp
+              AND {date_column} < $1::timestamp + interval '1 day'
+        """
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, (execution_date,))
+            for batch in cursor.fetch_record_batch():
+                # Driver batches can be larger than one row group
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield batch.slice(offset, batch_size)
+        finally:
+            cursor.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -85,3 +291,63 @@ class PostgresSource:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a Postgres identifier for queries built without psycopg2."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _stream_copy(
+    cursor,
+    copy_query: str,
+    convert_options: pa_csv.ConvertOptions,
+    batch_size: int
+) -> Iterator[pa.RecordBatch]:
+    """Run a COPY ... TO STDOUT query and parse its output as it arrives.
+
+    copy_expert() only writes to a file object, so it runs in a thread that
+    writes into an OS pipe while Arrow's streaming CSV reader consumes the
+    other end. Memory stays bounded by the pipe and one CSV block.
+
+    Args:
+        cursor: psycopg2 cursor
+        copy_query: COPY ... TO STDOUT WITH (FORMAT CSV, HEADER) query
+        convert_options: Arrow CSV conversion options
+        batch_size: Maximum number of rows per yielded batch
+
+    Yields:
+        Arrow record batches parsed from the COPY output
+    """
+    read_fd, write_fd = os.pipe()
+    copy_errors = []
+
+    def copy():
+        try:
+            with os.fdopen(write_fd, 'wb') as sink:
+                cursor.copy_expert(copy_query, sink)
+        except Exception as e:
+            copy_errors.append(e)
+
+    thread = threading.Thread(target=copy, daemon=True)
+    thread.start()
+
+    try:
+        # Closing the read end first makes an abandoned COPY fail with a broken
+        # pipe instead of blocking the writer thread forever
+        with os.fdopen(read_fd, 'rb') as source:
+            reader = pa_csv.open_csv(source, convert_options=convert_options)
+            for batch in reader:
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield batch.slice(offset, batch_size)
+    except Exception:
+        thread.join()
+        # A failed COPY truncates the stream; report the database error, not the parse error
+        if copy_errors:
+            raise copy_errors[0]
+        raise
+    finally:
+        thread.join()
+
+    if copy_errors:
+        raise copy_errors[0]
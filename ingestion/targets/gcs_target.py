@@ -4,6 +4,15 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
+import gcsfs
+import google.auth.transport.requests
+import pyarrow.fs as pa_fs
+from google.oauth2 import service_account
+
+GCS_SCOPE = 'https://www.googleapis.com/auth/devstorage.read_write'
+
+# Parquet is compressed internally; upload it as opaque bytes without gzip
+UPLOAD_CONTENT_TYPE = 'application/octet-stream'
 
 
 class GCSTarget:
@@ -20,10 +29,15 @@ class GCSTarget:
         self.partition_column = target_config.get('partition_column')
         self.file_format = target_config.get('file_format', 'parquet')
         self.credentials_path = target_config.get('credentials_path')
+        self.filesystem = target_config.get('filesystem', 'gcsfs')
+        self._fs = None
 
-        # Validate credentials if provided
-        if self.credentials_path:
-            self._validate_credentials()
+        if self.filesystem not in ('gcsfs', 'pyarrow'):
+            raise ValueError(f"Unsupported filesystem: {self.filesystem}")
+
+        # Load credentials once and hand them to the filesystem directly,
+        # instead of mutating the process-wide GOOGLE_APPLICATION_CREDENTIALS
+        self._credentials = self._load_credentials()
 
     def get_partition_path(self, partition_value: str) -> str:
         """Generate Hive-style partition path.
@@ -52,20 +66,75 @@ class GCSTarget:
                 f"GCS credentials file not found: {self.credentials_path}"
             )
 
-    def setup_credentials(self):
-        """Setup GCS credentials by setting environment variable.
+    def _load_credentials(self) -> Optional[service_account.Credentials]:
+        """Load service account credentials from credentials_path.
 
-        This sets GOOGLE_APPLICATION_CREDENTIALS which is automatically
-        used by Google Cloud client libraries and dlt.
+        Returns:
+            Service account credentials, or None to use Application Default
+            Credentials (including GOOGLE_APPLICATION_CREDENTIALS)
         """
-        if self.credentials_path:
-            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.credentials_path
-            print(f"✓ GCS credentials loaded from: {self.credentials_path}")
-        else:
+        if not self.credentials_path:
             if 'GOOGLE_APPLICATION_CREDENTIALS' in os.environ:
                 print(f"✓ Using GCS credentials from environment variable")
             else:
                 print("⚠ No GCS credentials specified. Using Application Default Credentials")
+            return None
+
+        self._validate_credentials()
+        credentials = service_account.Credentials.from_service_account_file(
+            self.credentials_path,
+            scopes=[GCS_SCOPE]
+        )
+        print(f"✓ GCS credentials loaded from: {self.credentials_path}")
+        return credentials
+
+    def get_filesystem(self):
+        """Get the filesystem used to write files to GCS.
+
+        Returns:
+            gcsfs.GCSFileSystem, or pyarrow.fs.GcsFileSystem when the target
+            is configured with ``filesystem: pyarrow``
+        """
+        if self._fs is None:
+            if self.filesystem == 'pyarrow':
+                # Native google-cloud-cpp client, bypasses fsspec entirely
+                if self._credentials is not None:
+                    # pyarrow only accepts a bearer token, which is valid for about an hour
+                    self._credentials.refresh(google.auth.transport.requests.Request())
+                    self._fs = pa_fs.GcsFileSystem(
+                        access_token=self._credentials.token,
+                        credential_token_expiration=self._credentials.expiry
+                    )
+                else:
+                    self._fs = pa_fs.GcsFileSystem(anonymous=False)
+            else:
+                self._fs = gcsfs.GCSFileSystem(token=self._credentials)
+        return self._fs
+
+    def write_file(self, file_path: str, data: bytes):
+        """Write a complete file to GCS in a single upload.
+
+        Objects are stored as application/octet-stream with no
+        Content-Encoding, so already-compressed parquet is never gzipped
+        again on upload.
+
+        Args:
+            file_path: Destination path (e.g., gs://bucket/path/file.parquet)
+            data: File contents
+        """
+        fs = self.get_filesystem()
+
+        if self.filesystem == 'pyarrow':
+            # pyarrow.fs paths are bucket/key without the gs:// scheme
+            with fs.open_output_stream(
+                file_path.removeprefix('gs://'),
+                compression=None,
+                metadata={'Content-Type': UPLOAD_CONTENT_TYPE}
+            ) as out:
+                out.write(data)
+        else:
+            # pipe() lets gcsfs choose a multipart upload for large files
+            fs.pipe(file_path, data, content_type=UPLOAD_CONTENT_TYPE)
 
     def get_destination_config(self, execution_date: str) -> Dict[str, str]:
         """Get dlt destination configuration for GCS.